@@ -0,0 +1,26 @@
+@echo off
+rem UserPromptSubmit hook: fast path in front of handover_inject.py (Windows).
+rem Python is only started when this session's .handover-ready-{session_id} marker exists.
+setlocal EnableDelayedExpansion
+
+if not exist "%USERPROFILE%\.claude\.handover-ready-*" (
+    rem No marker at all: drain the hook payload so the caller never writes to a closed pipe
+    findstr "^" >nul
+    exit /b 0
+)
+
+rem Keep the payload to match markers against it and to hand it to Python
+set "payload=%TEMP%\handover_inject_%RANDOM%%RANDOM%.json"
+findstr "^" > "%payload%"
+
+for %%M in ("%USERPROFILE%\.claude\.handover-ready-*") do (
+    set "name=%%~nxM"
+    rem Strip the 16-character ".handover-ready-" prefix to get the session ID
+    findstr /l /c:"!name:~16!" "%payload%" >nul && (
+        python -X utf8 "%~dp0handover_inject.py" < "%payload%"
+        goto done
+    )
+)
+
+:done
+del "%payload%" 2>nul
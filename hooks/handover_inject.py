@@ -1,17 +1,40 @@
 """UserPromptSubmit hook: inject HANDOVER path when ready.
 
-Checks for .handover-ready-{session_id} marker on every prompt.
+Checks for .handover-ready-{session_id} marker.
 If found, outputs the HANDOVER file path so the agent reads it.
 Silent when no marker exists (normal prompts).
+
+Normally started by handover_inject.sh / handover_inject.cmd, which skip
+launching Python entirely while this session has no marker.
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
+CLAUDE_DIR = Path.home() / ".claude"
+READY_PREFIX = ".handover-ready-"
+
+
+def pending_session_ids() -> list[str]:
+    """Return the session IDs that have a ready marker in ~/.claude."""
+    try:
+        with os.scandir(CLAUDE_DIR) as entries:
+            return [e.name[len(READY_PREFIX):] for e in entries if e.name.startswith(READY_PREFIX)]
+    except FileNotFoundError:
+        return []
+
 
 def main():
+    # Always drain stdin so the caller never writes to a closed pipe
     raw = sys.stdin.read()
+
+    # Decode the payload only if a marker belongs to this session; stale markers
+    # of other (possibly ended) sessions must not cost every prompt a decode
+    if not any(sid and sid in raw for sid in pending_session_ids()):
+        return
+
     try:
         data = json.loads(raw)
     except (json.JSONDecodeError, ValueError):
@@ -23,17 +46,16 @@ def main():
     if not session_id or not transcript_path:
         return
 
-    ready_marker = Path.home() / ".claude" / f".handover-ready-{session_id}"
-    if not ready_marker.exists():
+    # Consume the marker in a single syscall
+    ready_marker = CLAUDE_DIR / f"{READY_PREFIX}{session_id}"
+    try:
+        ready_marker.unlink()
+    except FileNotFoundError:
         return
 
     handover_path = Path(transcript_path).parent / f"HANDOVER-{session_id}.md"
-    if not handover_path.exists():
-        ready_marker.unlink(missing_ok=True)
-        return
-
-    print(f"[HANDOVER] Read this file: {handover_path}")
-    ready_marker.unlink(missing_ok=True)
+    if handover_path.exists():
+        print(f"[HANDOVER] Read this file: {handover_path}")
 
 
 if __name__ == "__main__":
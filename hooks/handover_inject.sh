@@ -0,0 +1,24 @@
+#!/bin/sh
+# UserPromptSubmit hook: fast path in front of handover_inject.py.
+#
+# Python is only started when this session's .handover-ready-{session_id}
+# marker exists, i.e. on the first prompt after its HANDOVER is generated.
+# On every other prompt the hook exits without paying for an interpreter start.
+
+# Reading the payload also drains stdin, so the caller never writes to a closed pipe
+payload=$(cat)
+
+# Pull session_id out of the JSON with parameter expansion (no extra processes)
+case $payload in
+    *'"session_id"'*) ;;
+    *) exit 0 ;;
+esac
+session_id=${payload#*\"session_id\"}
+session_id=${session_id#*\"}
+session_id=${session_id%%\"*}
+
+[ -n "$session_id" ] && [ -e "$HOME/.claude/.handover-ready-$session_id" ] || exit 0
+
+exec python -X utf8 "$(dirname "$0")/handover_inject.py" <<PAYLOAD
+$payload
+PAYLOAD
@@ -1,7 +1,7 @@
 """Minimal statusline for HANDOVER status display.
 
 Fallback for environments without statusline.py.
-Reads ~/.claude/handover-status.json and outputs status to the status bar.
+Prints the status line pre-rendered by the worker in ~/.claude/handover-status.line.
 
 Usage in settings.json (only when statusline.py is NOT installed):
   "statusLine": {
@@ -10,51 +10,34 @@ Usage in settings.json (only when statusline.py is NOT installed):
   }
 
 When statusline.py IS installed, this script is not needed —
-statusline.py reads the same JSON file directly.
+statusline.py reads ~/.claude/handover-status.json directly.
 """
 
-import json
-import sys
-from datetime import datetime
+import os
+import time
 from pathlib import Path
 
-STATUS_FILE = Path.home() / ".claude" / "handover-status.json"
+CLAUDE_DIR = Path.home() / ".claude"
+STATUS_LINE_FILE = CLAUDE_DIR / "handover-status.line"
 
-YELLOW = "\033[93m"
-GREEN = "\033[92m"
-RED = "\033[91m"
-RESET = "\033[0m"
+READY_DISPLAY_SECONDS = 60
 
 
 def main():
-    if not STATUS_FILE.exists():
+    # "{phase}\t{line}", rendered by handover_worker.write_status
+    try:
+        with open(STATUS_LINE_FILE, encoding="utf-8") as f:
+            phase, _, line = f.read().partition("\t")
+            mtime = os.fstat(f.fileno()).st_mtime
+    except OSError:
         return
 
-    try:
-        hs = json.loads(STATUS_FILE.read_text(encoding="utf-8"))
-    except Exception:
+    # "ready" auto-hides; the file's mtime is when the worker finished
+    if phase == "done" and time.time() - mtime >= READY_DISPLAY_SECONDS:
         return
 
-    phase = hs.get("phase", "")
-    step = hs.get("step", 0)
-    total = hs.get("total", 0)
-    updated = hs.get("updated_at", "")
-    progress = f" ({step}/{total})" if total else ""
-
-    if phase == "pass1":
-        print(f"{YELLOW}\U0001f4ddHANDOVER extracting{progress}{RESET}")
-    elif phase == "pass2":
-        print(f"{YELLOW}\U0001f4ddHANDOVER merging{progress}{RESET}")
-    elif phase == "error":
-        print(f"{RED}\U0001f4ddHANDOVER failed{RESET}")
-    elif phase == "done" and updated:
-        try:
-            done_dt = datetime.fromisoformat(updated)
-            elapsed = (datetime.now(done_dt.tzinfo) - done_dt).total_seconds()
-            if elapsed < 60:
-                print(f"{GREEN}\U0001f4ddHANDOVER ready{RESET}")
-        except Exception:
-            pass
+    if line:
+        print(line)
 
 
 if __name__ == "__main__":
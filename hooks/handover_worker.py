@@ -5,9 +5,12 @@ Two-pass architecture:
   Pass 2: Merge existing HANDOVER + new fragment (distilled + distilled)
 
 This keeps processed content separate from raw transcript noise.
+When both passes fit in one prompt they run as a single claude -p call.
 """
 
+import itertools
 import json
+import os
 import shutil
 import subprocess
 import sys
@@ -15,13 +18,111 @@ import tempfile
 from datetime import datetime
 from pathlib import Path
 
-STATUS_FILE = Path.home() / ".claude" / "handover-status.json"
+try:
+    import orjson  # Optional: faster transcript parsing
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+CLAUDE_DIR = Path.home() / ".claude"
+STATUS_FILE = CLAUDE_DIR / "handover-status.json"
+STATUS_LINE_FILE = CLAUDE_DIR / "handover-status.line"  # Pre-rendered for handover_statusline.py
+
+# Process umask (os.umask can only be read by setting it), applied to atomically written files
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+YELLOW = "\033[93m"
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+# Conversation diffs shorter than this (in characters) are not worth a claude -p
+# call when a HANDOVER already exists; the existing one is reused as is and the
+# skipped window is carried into the next run (see is_shallow_diff).
+MIN_DIFF_CHARS = 1500
+
+# Above this many input characters (summary + transcript as written for sonnet, plus
+# the existing HANDOVER's size in bytes), extract and merge run as two separate
+# claude -p calls instead of one.
+COMBINED_PASS_MAX_CHARS = 200_000
+
+# Per-message cap in the conversation transcript
+MAX_ENTRY_CHARS = 2000
+TRUNC_SUFFIX = "\n[...truncated...]"
+
+# Opening of the user message that carries a compaction summary into the next cycle
+SUMMARY_MARKER = "continued from a previous conversation"
+
+# Block size for scanning the transcript backwards for compact_boundary entries
+SCAN_CHUNK = 1 << 20
+
+# Prompt sections shared by the single-call and two-pass flows
+EXTRACT_FOCUS = """Focus on these four categories ONLY:
+1. **Decision rationale**: Why choice A was made over B. Include the reasoning chain, not just the conclusion.
+2. **Failed approaches**: What was tried and didn't work. Include WHY it failed so the same mistake isn't repeated.
+3. **User directives**: Session-specific policy decisions and scope boundaries for the current task.
+4. **Corrections given during session**: Mistakes the agent made that the user explicitly corrected. Include what was wrong and what the correct behavior is, so the same mistake is not repeated after compaction.
+
+Do NOT include:
+- Code snippets, file paths, or configuration examples (the agent can read source files directly)
+- Technical details that are already documented in code or config
+- Test procedures or verification steps
+- Anything the compaction summary already covers"""
+
+MERGE_RULES = """- Deduplicate: if both cover the same decision/event, keep the more detailed version
+- User directives and policy decisions never expire — always preserve them
+- For technical details, prefer the newer document when conflicting
+- Compress older sections if total exceeds 3000 words, but never drop user directives
+- Maintain chronological structure where possible"""
+
+
+def replace_file(path: Path, data: bytes):
+    """Write data to a sibling temp file and rename it into place so readers never see a torn write.
+
+    The temp name is unique, so workers of different sessions can update the shared status files at once.
+    """
+    # The ".tmp-" prefix keeps orphans from a crashed worker out of the .handover-ready-* glob
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".tmp-{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o666 & ~UMASK)  # mkstemp uses 0600; keep the usual file mode
+        os.replace(tmp, path)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def render_status(phase: str, step: int, total: int) -> str:
+    """Render the status bar line for a phase (empty when nothing should be shown)."""
+    progress = f" ({step}/{total})" if total else ""
+    if phase == "pass1":
+        return f"{YELLOW}\U0001f4ddHANDOVER extracting{progress}{RESET}"
+    if phase == "pass2":
+        return f"{YELLOW}\U0001f4ddHANDOVER merging{progress}{RESET}"
+    if phase == "error":
+        return f"{RED}\U0001f4ddHANDOVER failed{RESET}"
+    if phase == "done":
+        return f"{GREEN}\U0001f4ddHANDOVER ready{RESET}"
+    return ""
 
 
 def write_status(phase: str, step: int = 0, total: int = 0, session_id: str = "", error: str = ""):
-    """Write current status to JSON file for external display (e.g., statusline.py)."""
-    STATUS_FILE.write_text(
-        json.dumps({
+    """Write current status for external display.
+
+    handover-status.json carries the full status (e.g., for statusline.py).
+    handover-status.line holds "{phase}\t{rendered line}" so handover_statusline.py
+    can print it without any parsing on every prompt.
+    """
+    replace_file(
+        STATUS_FILE,
+        _dumps({
             "phase": phase,  # pass1, pass2, done, error
             "step": step,
             "total": total,
@@ -29,8 +130,17 @@ def write_status(phase: str, step: int = 0, total: int = 0, session_id: str = ""
             "updated_at": datetime.now().isoformat(),
             "error": error,
         }),
-        encoding="utf-8",
     )
+    replace_file(STATUS_LINE_FILE, f"{phase}\t{render_status(phase, step, total)}".encode("utf-8"))
+
+
+def signal_ready(session_id: str):
+    """Signal inject hook that HANDOVER is ready.
+
+    The marker is written under a temporary name and renamed into place,
+    so the inject hook never sees a partially written marker.
+    """
+    replace_file(CLAUDE_DIR / f".handover-ready-{session_id}", session_id.encode("utf-8"))
 
 
 def extract_text(msg: dict) -> str:
@@ -39,11 +149,10 @@ def extract_text(msg: dict) -> str:
     if isinstance(content, str):
         return content
     if isinstance(content, list):
-        parts = []
-        for block in content:
-            if isinstance(block, dict) and block.get("type") == "text":
-                parts.append(block.get("text", ""))
-        return "\n".join(parts)
+        # type() is check: transcript blocks are plain dicts from the JSON decoder
+        return "\n".join([
+            block.get("text", "") for block in content if type(block) is dict and block.get("type") == "text"
+        ])
     return ""
 
 
@@ -52,126 +161,215 @@ def has_tool_use(msg: dict) -> bool:
     content = msg.get("content", [])
     if not isinstance(content, list):
         return False
-    return any(
-        isinstance(block, dict) and block.get("type") == "tool_use"
-        for block in content
-    )
+    return any(type(block) is dict and block.get("type") == "tool_use" for block in content)
 
 
-def parse_jsonl(transcript_path: str):
-    """Parse jsonl and return conversation entries + compaction info."""
-    lines = Path(transcript_path).read_text(encoding="utf-8").splitlines()
+def conversation_entry(obj: dict) -> str | None:
+    """Format a transcript entry for the conversation diff, or None if it is noise."""
+    entry_type = obj.get("type", "")
+    if entry_type not in ("user", "assistant"):
+        return None
 
-    # Find all compact_boundary positions
-    compact_boundaries = []
-    for i, line in enumerate(lines):
-        try:
-            obj = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if obj.get("type") == "system" and obj.get("subtype") == "compact_boundary":
-            compact_boundaries.append(i)
+    msg = obj.get("message", {})
+    role = msg.get("role", entry_type)
 
-    if not compact_boundaries:
-        return None, None
+    # Assistant messages with tool_use → skip (operational noise)
+    # Decision rationale and discussion happen in pure-text assistant turns
+    if role == "assistant" and has_tool_use(msg):
+        return None
 
-    last_boundary = compact_boundaries[-1]
+    text = extract_text(msg)
 
-    # Compaction summary: first user message after compact_boundary
-    compaction_summary = ""
-    for i in range(last_boundary + 1, min(last_boundary + 5, len(lines))):
-        try:
-            obj = json.loads(lines[i])
-        except json.JSONDecodeError:
-            continue
-        msg = obj.get("message", {})
-        if msg.get("role") == "user":
-            text = extract_text(msg)
-            if "continued from a previous conversation" in text:
-                compaction_summary = text
-                break
+    if not text.strip():
+        return None
 
-    # Determine conversation range (diff-based)
-    if len(compact_boundaries) >= 2:
-        start_idx = compact_boundaries[-2]  # From previous compact to current
-    else:
-        start_idx = 0  # First compaction: process everything
-
-    # Extract conversation between start_idx and last_boundary
-    # Strategy: skip assistant tool-operation messages (noise), keep conversation
-    conversation = []
-    for i in range(start_idx, last_boundary):
-        try:
-            obj = json.loads(lines[i])
-        except json.JSONDecodeError:
-            continue
+    # Skip very short system-injected messages
+    if role == "user" and len(text) < 10:
+        return None
 
-        entry_type = obj.get("type", "")
-        if entry_type not in ("user", "assistant"):
-            continue
+    # Truncate long messages (same limit for both roles)
+    if len(text) > MAX_ENTRY_CHARS:
+        text = text[:MAX_ENTRY_CHARS] + TRUNC_SUFFIX
 
-        msg = obj.get("message", {})
-        role = msg.get("role", entry_type)
+    return f"[{role}]: {text}"
 
-        # Assistant messages with tool_use → skip (operational noise)
-        # Decision rationale and discussion happen in pure-text assistant turns
-        if role == "assistant" and has_tool_use(msg):
-            continue
 
-        text = extract_text(msg)
+def is_compact_boundary(line: bytes) -> bool:
+    """Check if a raw jsonl line is a compact_boundary entry.
 
-        if not text.strip():
-            continue
+    A substring test rejects ordinary messages before any JSON decoding.
+    """
+    if b"compact_boundary" not in line:
+        return False
+    try:
+        obj = _loads(line)
+    except ValueError:
+        return False
+    return obj.get("type") == "system" and obj.get("subtype") == "compact_boundary"
 
-        # Skip very short system-injected messages
-        if role == "user" and len(text) < 10:
-            continue
 
-        # Truncate: user messages (directives/corrections) get more room
-        max_len = 2000 if role == "user" else 2000
-        if len(text) > max_len:
-            text = text[:max_len] + "\n[...truncated...]"
+def find_last_boundaries(f, count: int) -> list[tuple[int, int]]:
+    """Find the last `count` compact_boundary lines of a binary file, newest first.
 
-        conversation.append(f"[{role}]: {text}")
+    Reads SCAN_CHUNK-sized blocks backwards from EOF and stops as soon as enough
+    boundaries are found, so earlier compaction cycles are never read.
+    Returns (start, end) byte offsets of each boundary line.
+    """
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    carry = b""  # Head of a line that started in a block not read yet
+    found = []
+    while pos > 0 and len(found) < count:
+        size = min(SCAN_CHUNK, pos)
+        pos -= size
+        f.seek(pos)
+        buf = f.read(size) + carry
+
+        # Bytes before the first newline belong to a line that starts earlier
+        cut = 0
+        if pos:
+            cut = buf.find(b"\n") + 1
+            if not cut:
+                carry = buf
+                continue
+        carry = buf[:cut]
+
+        hi = len(buf)
+        while len(found) < count:
+            idx = buf.rfind(b"compact_boundary", cut, hi)
+            if idx < 0:
+                break
+            start = max(buf.rfind(b"\n", cut, idx) + 1, cut)
+            end = buf.find(b"\n", idx) + 1 or len(buf)
+            if is_compact_boundary(buf[start:end]):
+                found.append((pos + start, pos + end))
+            hi = start
+    return found
+
+
+def parse_jsonl(transcript_path: str, carried_start: int | None = None):
+    """Parse jsonl and return conversation entries + compaction info.
+
+    The last two compact_boundary entries are located by scanning backwards
+    from EOF, then only the latest compaction cycle plus the lines right after
+    it are read and decoded.
+    carried_start is the byte offset of a window skipped by an earlier run;
+    when given, the conversation is read from there instead.
+    Returns (compaction_summary, conversation, start offset of the conversation).
+    """
+    with open(transcript_path, "rb") as f:
+        boundaries = find_last_boundaries(f, 2)
+        if not boundaries:
+            return None, None, 0
+
+        last_start = boundaries[0][0]
+
+        # Determine conversation range (diff-based):
+        # from previous compact to current, or everything on the first compaction
+        start = boundaries[1][1] if len(boundaries) > 1 else 0
+        if carried_start is not None and carried_start < start:
+            start = carried_start
+        f.seek(start)
+
+        # Extract conversation between start and the latest boundary
+        # Strategy: skip assistant tool-operation messages (noise), keep conversation
+        conversation = []
+        offset = start
+        for line in f:
+            if offset >= last_start:
+                break  # The latest boundary line itself
+            offset += len(line)
+            try:
+                obj = _loads(line)
+            except ValueError:
+                continue
+            entry = conversation_entry(obj)
+            if entry:
+                conversation.append(entry)
+
+        # Compaction summary: first user message after compact_boundary
+        compaction_summary = ""
+        for line in itertools.islice(f, 4):
+            if SUMMARY_MARKER.encode() not in line:
+                continue
+            try:
+                obj = _loads(line)
+            except ValueError:
+                continue
+            msg = obj.get("message", {})
+            if msg.get("role") == "user":
+                text = extract_text(msg)
+                if SUMMARY_MARKER in text:
+                    compaction_summary = text
+                    break
+
+    return compaction_summary, conversation, start
+
+
+def is_shallow_diff(conversation: list) -> bool:
+    """Check if a conversation diff is too small to be worth a claude -p call.
+
+    Summaries re-injected by earlier compactions are not counted, and any other
+    user message makes the diff worth extracting regardless of its size.
+    """
+    size = 0
+    for entry in conversation:
+        if entry.startswith("[user]: "):
+            if SUMMARY_MARKER not in entry:
+                return False
+            continue
+        size += len(entry)
+    return size < MIN_DIFF_CHARS
 
-    return compaction_summary, conversation
 
+def call_claude(prompt: str, out_path: Path, timeout: int = 180) -> Path | None:
+    """Call claude -p --model sonnet with Read tool access.
 
-def call_claude(prompt: str, timeout: int = 180) -> str | None:
-    """Call claude -p --model sonnet with Read tool access."""
-    result = subprocess.run(
-        ["claude", "-p", "--model", "sonnet", "--allowedTools", "Read"],
-        input=prompt,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        encoding="utf-8",
-        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-    )
-    if result.returncode == 0 and result.stdout.strip():
-        return result.stdout.strip()
+    The response is written by the child straight to out_path, which is returned on success.
+    """
+    with open(out_path, "wb") as out:
+        result = subprocess.run(
+            ["claude", "-p", "--model", "sonnet", "--allowedTools", "Read"],
+            input=prompt.encode("utf-8"),
+            stdout=out,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+    # Whitespace-only output counts as no output
+    if result.returncode == 0 and out_path.read_bytes().strip():
+        return out_path
     return None
 
 
-def pass1_extract(compaction_summary: str, conversation: list, work_dir: Path) -> str | None:
-    """Pass 1: Extract HANDOVER fragment from raw conversation diff.
+def write_pass1_inputs(compaction_summary: str, conversation: list, work_dir: Path) -> tuple[Path, Path, int]:
+    """Write the compaction summary and conversation transcript for sonnet to Read.
 
-    Data is written to temp files and sonnet reads them via Read tool.
-    This prevents sonnet from treating inline transcript as conversation to continue.
+    Returns both file paths and the number of characters written to them.
     """
     transcript_text = "\n\n".join(conversation)
 
     if len(transcript_text) > 150_000:
         transcript_text = transcript_text[-150_000:]
 
-    if len(compaction_summary) > 20_000:
-        compaction_summary = compaction_summary[:20_000] + "\n[...truncated...]"
-
     transcript_file = work_dir / "transcript.txt"
     summary_file = work_dir / "compaction_summary.txt"
     transcript_file.write_text(transcript_text, encoding="utf-8")
-    summary_file.write_text(compaction_summary, encoding="utf-8")
 
+    # Cap the summary while writing; a summary under the cap is written as is, without a copy
+    with open(summary_file, "w", encoding="utf-8") as f:
+        written = f.write(compaction_summary[:20_000])
+        if len(compaction_summary) > 20_000:
+            written += f.write(TRUNC_SUFFIX)
+    return summary_file, transcript_file, written + len(transcript_text)
+
+
+def pass1_extract(summary_file: Path, transcript_file: Path, work_dir: Path) -> Path | None:
+    """Pass 1: Extract HANDOVER fragment from raw conversation diff.
+
+    Data comes from the temp files written by write_pass1_inputs; sonnet reads them via Read tool.
+    This prevents sonnet from treating inline transcript as conversation to continue.
+    """
     prompt = f"""You are creating a HANDOVER document that supplements a compaction summary.
 
 Read these two files:
@@ -180,17 +378,7 @@ Read these two files:
 
 Read both files. Then write a HANDOVER document containing what the compaction summary is MISSING.
 
-Focus on these four categories ONLY:
-1. **Decision rationale**: Why choice A was made over B. Include the reasoning chain, not just the conclusion.
-2. **Failed approaches**: What was tried and didn't work. Include WHY it failed so the same mistake isn't repeated.
-3. **User directives**: Session-specific policy decisions and scope boundaries for the current task.
-4. **Corrections given during session**: Mistakes the agent made that the user explicitly corrected. Include what was wrong and what the correct behavior is, so the same mistake is not repeated after compaction.
-
-Do NOT include:
-- Code snippets, file paths, or configuration examples (the agent can read source files directly)
-- Technical details that are already documented in code or config
-- Test procedures or verification steps
-- Anything the compaction summary already covers
+{EXTRACT_FOCUS}
 
 Rules:
 - Write in English
@@ -198,37 +386,58 @@ Rules:
 - Use markdown headers
 - Output ONLY the HANDOVER document"""
 
-    return call_claude(prompt)
+    return call_claude(prompt, work_dir / "new_fragment.md")
 
 
-def pass2_merge(existing_handover: str, new_fragment: str, work_dir: Path) -> str | None:
+def pass2_merge(existing_handover_path: Path, fragment_file: Path, work_dir: Path) -> Path | None:
     """Pass 2: Merge two distilled HANDOVER documents.
 
     Both inputs are already refined — merge as peer-level documents.
     """
-    existing_file = work_dir / "existing_handover.md"
-    fragment_file = work_dir / "new_fragment.md"
-    existing_file.write_text(existing_handover, encoding="utf-8")
-    fragment_file.write_text(new_fragment, encoding="utf-8")
-
     prompt = f"""You are merging two HANDOVER documents into one.
 
 Read these two files:
-1. Existing HANDOVER (older, from previous compaction cycles): {existing_file}
+1. Existing HANDOVER (older, from previous compaction cycles): {existing_handover_path}
 2. New HANDOVER fragment (from latest compaction cycle): {fragment_file}
 
 Both are already distilled summaries (not raw conversation). Merge them into a single coherent document.
 
 Merge rules:
-- Deduplicate: if both cover the same decision/event, keep the more detailed version
-- User directives and policy decisions never expire — always preserve them
-- For technical details, prefer the newer document when conflicting
-- Compress older sections if total exceeds 3000 words, but never drop user directives
-- Maintain chronological structure where possible
+{MERGE_RULES}
 - Write in English, use markdown headers
 - Output ONLY the merged HANDOVER document"""
 
-    return call_claude(prompt, timeout=120)
+    return call_claude(prompt, work_dir / "merged.md", timeout=120)
+
+
+def combined_pass(
+    summary_file: Path, transcript_file: Path, existing_handover_path: Path, work_dir: Path
+) -> Path | None:
+    """Extract and merge in a single call: Pass 1 + Pass 2 without a second claude -p spawn.
+
+    Used when an existing HANDOVER is present and all inputs comfortably fit in one prompt.
+    """
+    prompt = f"""You are updating a HANDOVER document after a new compaction cycle.
+
+Read these three files:
+1. Existing HANDOVER (older, from previous compaction cycles): {existing_handover_path}
+2. Compaction summary (what is already preserved): {summary_file}
+3. Conversation transcript (raw source for the latest cycle): {transcript_file}
+
+Read all three files. Then work in two steps and output only the result of the second.
+
+Step 1 — Extract what the compaction summary is MISSING from the transcript.
+
+{EXTRACT_FOCUS}
+
+Step 2 — Merge the extracted content into the existing HANDOVER as a single coherent document.
+
+Merge rules:
+{MERGE_RULES}
+- Write in English, use markdown headers
+- Output ONLY the merged HANDOVER document"""
+
+    return call_claude(prompt, work_dir / "merged.md", timeout=240)
 
 
 def main():
@@ -245,14 +454,23 @@ def main():
     transcript_dir = Path(transcript_path).parent
     handover_path = transcript_dir / f"HANDOVER-{session_id}.md"
     error_log = transcript_dir / f"HANDOVER-{session_id}.error.log"
+    # Start offset of a conversation window skipped as shallow by an earlier run
+    carry_file = transcript_dir / f"HANDOVER-{session_id}.carry"
 
-    # Read existing HANDOVER if any
-    existing_handover = ""
-    if handover_path.exists():
-        existing_handover = handover_path.read_text(encoding="utf-8")
+    # Existing HANDOVER (if any) is read by sonnet in place; only its size is needed here
+    try:
+        existing_size = handover_path.stat().st_size
+    except FileNotFoundError:
+        existing_size = 0
+    has_merge = existing_size > 0
+
+    try:
+        carried_start = int(carry_file.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        carried_start = None
 
     # Parse jsonl
-    compaction_summary, conversation = parse_jsonl(transcript_path)
+    compaction_summary, conversation, start = parse_jsonl(transcript_path, carried_start)
 
     if compaction_summary is None:
         return  # No compaction found
@@ -260,45 +478,70 @@ def main():
     if not conversation:
         return  # No conversation to analyze
 
-    work_dir = Path(tempfile.mkdtemp(prefix="handover_"))
+    if has_merge and is_shallow_diff(conversation):
+        # Shallow compaction: nothing new worth extracting, re-inject existing HANDOVER.
+        # The next run reads from this window's start, so its content is not lost.
+        carry_file.write_text(str(start), encoding="utf-8")
+        write_status("done", 0, 0, session_id)
+        signal_ready(session_id)
+        return
+
+    # Private (0700, unguessable name) scratch dir for the prompt inputs and responses
+    scratch = tempfile.TemporaryDirectory(prefix="handover_", ignore_cleanup_errors=True)
+    work_dir = Path(scratch.name)
 
     try:
-        has_merge = bool(existing_handover)
-
-        # Pass 1: Extract new fragment from raw conversation
-        write_status("pass1", 1 if has_merge else 0, 2 if has_merge else 0, session_id)
-        new_fragment = pass1_extract(compaction_summary, conversation, work_dir)
-
-        if not new_fragment:
-            write_status("error", 0, 0, session_id, "Pass 1 returned no output")
-            error_log.write_text(
-                f"{datetime.now().isoformat()}: Pass 1 failed (no output from claude -p)\n",
-                encoding="utf-8",
-            )
-            return
-
-        # Pass 2: Merge with existing (only if existing HANDOVER exists)
-        if existing_handover:
-            write_status("pass2", 2, 2, session_id)
-            merged = pass2_merge(existing_handover, new_fragment, work_dir)
-            if merged:
-                handover_path.write_text(merged, encoding="utf-8")
-            else:
-                # Pass 2 failed — still save Pass 1 output (better than nothing)
-                handover_path.write_text(new_fragment, encoding="utf-8")
+        # Inputs are written once and shared by the combined call and the two-pass fallback
+        summary_file, transcript_file, input_chars = write_pass1_inputs(compaction_summary, conversation, work_dir)
+
+        # Single call when merging and everything fits in one prompt
+        merged = None
+        if has_merge and input_chars + existing_size <= COMBINED_PASS_MAX_CHARS:
+            write_status("pass2", 0, 0, session_id)
+            merged = combined_pass(summary_file, transcript_file, handover_path, work_dir)
+            if not merged:
                 error_log.write_text(
-                    f"{datetime.now().isoformat()}: Pass 2 failed, saved Pass 1 output only\n",
+                    f"{datetime.now().isoformat()}: Combined pass failed, falling back to two passes\n",
                     encoding="utf-8",
                 )
+
+        if merged:
+            shutil.copyfile(merged, handover_path)
         else:
-            # First compaction — Pass 1 output is the HANDOVER
-            handover_path.write_text(new_fragment, encoding="utf-8")
+            # Pass 1: Extract new fragment from raw conversation
+            write_status("pass1", 1 if has_merge else 0, 2 if has_merge else 0, session_id)
+            new_fragment = pass1_extract(summary_file, transcript_file, work_dir)
+
+            if not new_fragment:
+                write_status("error", 0, 0, session_id, "Pass 1 returned no output")
+                error_log.write_text(
+                    f"{datetime.now().isoformat()}: Pass 1 failed (no output from claude -p)\n",
+                    encoding="utf-8",
+                )
+                return
+
+            # Pass 2: Merge with existing (only if existing HANDOVER exists)
+            if has_merge:
+                write_status("pass2", 2, 2, session_id)
+                merged = pass2_merge(handover_path, new_fragment, work_dir)
+                if merged:
+                    shutil.copyfile(merged, handover_path)
+                else:
+                    # Pass 2 failed — still save Pass 1 output (better than nothing)
+                    shutil.copyfile(new_fragment, handover_path)
+                    error_log.write_text(
+                        f"{datetime.now().isoformat()}: Pass 2 failed, saved Pass 1 output only\n",
+                        encoding="utf-8",
+                    )
+            else:
+                # First compaction — Pass 1 output is the HANDOVER
+                shutil.copyfile(new_fragment, handover_path)
 
+        # Any carried window is now part of the HANDOVER
+        carry_file.unlink(missing_ok=True)
         write_status("done", 0, 0, session_id)
 
-        # Signal inject hook that HANDOVER is ready
-        ready_marker = Path.home() / ".claude" / f".handover-ready-{session_id}"
-        ready_marker.write_text(session_id, encoding="utf-8")
+        signal_ready(session_id)
 
     except subprocess.TimeoutExpired:
         write_status("error", 0, 0, session_id, "claude -p timed out")
@@ -313,7 +556,7 @@ def main():
             encoding="utf-8",
         )
     finally:
-        shutil.rmtree(work_dir, ignore_errors=True)
+        scratch.cleanup()
 
 
 if __name__ == "__main__":